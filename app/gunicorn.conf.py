@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration for the Todo App
+
+Note: gevent workers only help with I/O that goes through patched Python
+sockets. C-extension drivers that do their own blocking I/O (e.g. psycopg2)
+need a gevent-friendly alternative or they will stall the worker.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS', 2 * multiprocessing.cpu_count() + 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
@@ -2,43 +2,186 @@
 Flask application factory
 """
 
-from flask import Flask, render_template
+import atexit
+import functools
+import importlib
+import logging
+import os
+import sys
+from logging.handlers import QueueHandler
+
+from flask import Flask
+from flask.logging import default_handler
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache, ModuleLoader
+
+from .extensions import init_json
+from .routes.pages import cached_page, clear_page_cache, reset_page_cache
+
+
+# (module path, blueprint attribute) for every blueprint, in registration order
+_BLUEPRINTS = (
+    ('.routes.main', 'main_bp'),
+    ('.routes.help', 'help_bp'),
+    ('.routes.contact', 'contact_bp'),
+)
+
+
+def _register(app, module_path, attr):
+    """Import a blueprint module on demand and register its blueprint"""
+    module = importlib.import_module(module_path, __package__)
+    app.register_blueprint(getattr(module, attr))
+
+
+def _unpatched(module_name, attr):
+    """Return a stdlib object as it was before any gevent monkey-patching"""
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None:
+        return monkey.get_original(module_name, attr)
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _configure_logging(app):
+    """
+    Send app log records through a queue to a stderr writer on its own OS thread
+    
+    Request handlers only enqueue records. The writer is started with the
+    unpatched thread, lock and queue primitives, so under gevent the blocking
+    stderr write happens off the event loop's thread instead of in a greenlet.
+    """
+    start_new_thread = _unpatched('_thread', 'start_new_thread')
+    allocate_lock = _unpatched('_thread', 'allocate_lock')
+    
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(default_handler.formatter)
+    # Only the writer thread uses this handler, so give it a native lock too
+    handler.lock = _unpatched('_thread', 'RLock')()
+    
+    log_queue = _unpatched('queue', 'SimpleQueue')()
+    stopped = allocate_lock()
+    stopped.acquire()
+    
+    def write_records():
+        while (record := log_queue.get()) is not None:
+            handler.handle(record)
+        stopped.release()
+    
+    def stop():
+        log_queue.put(None)
+        stopped.acquire(timeout=5)
+    
+    start_new_thread(write_records, ())
+    atexit.register(stop)
+    
+    app.logger.removeHandler(default_handler)
+    app.logger.addHandler(QueueHandler(log_queue))
+
+
+def _configure_templates(app):
+    """
+    Set up the Jinja environment for the current config
+    
+    Outside debug mode templates are never re-checked on disk, and can be
+    served from a bytecode cache directory (JINJA_BYTECODE_CACHE_DIR) or a
+    precompiled archive built with compile_templates (JINJA_PRECOMPILED_TEMPLATES).
+    """
+    jinja_env = app.jinja_env
+    auto_reload = app.config.get('TEMPLATES_AUTO_RELOAD')
+    jinja_env.auto_reload = app.debug if auto_reload is None else auto_reload
+    
+    loader = app.create_global_jinja_loader()
+    bytecode_cache = None
+    if not app.debug:
+        if app.config.get('JINJA_PRECOMPILED_TEMPLATES'):
+            loader = ChoiceLoader([ModuleLoader(app.config['JINJA_PRECOMPILED_TEMPLATES']), loader])
+        if app.config.get('JINJA_BYTECODE_CACHE_DIR'):
+            bytecode_cache = FileSystemBytecodeCache(app.config['JINJA_BYTECODE_CACHE_DIR'])
+    
+    jinja_env.loader = loader
+    jinja_env.bytecode_cache = bytecode_cache
+    jinja_env.cache.clear()
+    reset_page_cache()
+
+
+def not_found_error(error):
+    """Handle 404 errors by serving the main page"""
+    return cached_page('index.html', 404)
+
+
+def internal_error(error):
+    """Handle 500 errors with a JSON body"""
+    return {'error': 'Internal server error'}, 500
+
+
+@functools.lru_cache(maxsize=1)
+def _base_app():
+    """
+    Build the Flask app once per process
+    
+    Blueprint registration and error handler setup only happen here, so
+    repeated create_app calls (e.g. one per test) are cheap.
+    
+    Returns:
+        tuple: The shared Flask app and a snapshot of its default config
+    """
+    app = Flask(__name__)
+    init_json(app)
+    _configure_logging(app)
+    
+    # Defaults from environment variables
+    app.config['REDIS_URL'] = os.environ.get('REDIS_URL')
+    app.config['TASK_CACHE_TTL'] = int(os.environ.get('TASK_CACHE_TTL', 24 * 60 * 60))
+    app.config['JINJA_BYTECODE_CACHE_DIR'] = os.environ.get('JINJA_BYTECODE_CACHE_DIR')
+    app.config['JINJA_PRECOMPILED_TEMPLATES'] = os.environ.get('JINJA_PRECOMPILED_TEMPLATES')
+    app.config['WARMUP'] = os.environ.get('APP_WARMUP', '').lower() in ('1', 'true', 'yes')
+    
+    # Initialize extensions
+    # Extensions are created lazily from config (see extensions.py)
+    
+    # Register blueprints (imported lazily to keep process start-up cheap)
+    for module_path, attr in _BLUEPRINTS:
+        _register(app, module_path, attr)
+    
+    # Re-render cached static pages on every request while debugging
+    app.before_request(clear_page_cache)
+    
+    # Register error handlers
+    app.register_error_handler(404, not_found_error)
+    app.register_error_handler(500, internal_error)
+    
+    return app, dict(app.config)
 
 
 def create_app(config=None):
     """
     Application factory pattern for creating Flask app instances
     
+    The app itself is built once and cached; each call resets its config
+    to the defaults and applies the given overrides.
+    
     Args:
         config: Configuration object or dictionary
         
     Returns:
         Flask: Configured Flask application instance
     """
-    app = Flask(__name__)
+    app, default_config = _base_app()
     
     # Configure the app
+    app.config.clear()
+    app.config.update(default_config)
     if config:
         app.config.update(config)
     
-    # Initialize extensions
-    # Extensions will be initialized here as needed
-    
-    # Register blueprints
-    from .routes.main import main_bp
-    from .routes.help import help_bp
-    from .routes.contact import contact_bp
-    app.register_blueprint(main_bp)
-    app.register_blueprint(help_bp)
-    app.register_blueprint(contact_bp)
+    # Drop config-dependent extension state so it is rebuilt from the new config
+    app.extensions.pop('redis', None)
+    app.extensions.pop('task_manager', None)
     
-    # Register error handlers
-    @app.errorhandler(404)
-    def not_found_error(error):
-        return render_template('404.html'), 404 if app.config.get('TESTING') else render_template('index.html'), 404
+    _configure_templates(app)
     
-    @app.errorhandler(500)
-    def internal_error(error):
-        return {'error': 'Internal server error'}, 500
+    # Pay one-off model setup costs now instead of on the first API request.
+    # Off by default so tests and short-lived processes keep lazy imports.
+    if app.config['WARMUP']:
+        from .models import warmup
+        warmup()
     
     return app
\ No newline at end of file
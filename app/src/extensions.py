@@ -2,4 +2,71 @@
 Flask extensions initialization
 """
 
-# Extensions will be initialized here as needed
\ No newline at end of file
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson has no PyPy build; Flask's stdlib provider is used instead
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson
+    
+    Used for jsonify() responses, request.get_json() and the tojson filter.
+    Like Flask's DefaultJSONProvider it sorts keys and sends dates, decimals
+    and other non-native types through DefaultJSONProvider.default (so dates
+    are HTTP date strings). Values orjson cannot encode at all, such as
+    integers wider than 64 bits, fall back to the stdlib provider.
+    
+    Remaining differences: non-ASCII text is emitted as UTF-8 rather than
+    \\u escapes, and output is always compact (no debug-mode indentation).
+    """
+    
+    default = staticmethod(DefaultJSONProvider.default)
+    sort_keys = DefaultJSONProvider.sort_keys
+    
+    def __init__(self, app):
+        super().__init__(app)
+        self._fallback = DefaultJSONProvider(app)
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return self._fallback.dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def init_json(app):
+    """Switch the app to the orjson provider when orjson is installed"""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+def get_redis():
+    """
+    Return the Redis client for the current app
+    
+    Redis is optional: when REDIS_URL is not configured this returns None and
+    tasks are not persisted server-side.
+    
+    Returns:
+        redis.Redis or None: Client created on first use and cached on the app
+    """
+    url = current_app.config.get('REDIS_URL')
+    if not url:
+        return None
+    
+    client = current_app.extensions.get('redis')
+    if client is None:
+        import redis
+        client = current_app.extensions['redis'] = redis.Redis.from_url(url, decode_responses=False)
+    return client
\ No newline at end of file
@@ -2,6 +2,26 @@
 Models package
 """
 
-from .task import Task, TaskManager
+from .task import (
+    TASK_CREATE_ADAPTER,
+    TASK_UPDATE_ADAPTER,
+    Task,
+    TaskCreate,
+    TaskManager,
+    TaskStore,
+    TaskUpdate,
+    TaskView,
+    warmup,
+)
 
-__all__ = ['Task', 'TaskManager']
\ No newline at end of file
+__all__ = [
+    'Task',
+    'TaskCreate',
+    'TaskUpdate',
+    'TaskManager',
+    'TaskStore',
+    'TaskView',
+    'TASK_CREATE_ADAPTER',
+    'TASK_UPDATE_ADAPTER',
+    'warmup',
+]
\ No newline at end of file
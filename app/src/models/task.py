@@ -2,58 +2,284 @@
 Task model with Pydantic validation
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
-from datetime import datetime
-import uuid
+from array import array
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, field_serializer
+from typing import Annotated, Optional
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson has no PyPy build
+    orjson = None
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _format_timestamp(created_at: int) -> str:
+    """Format epoch nanoseconds as an ISO 8601 UTC string (microsecond precision)"""
+    return (_EPOCH + timedelta(microseconds=created_at // 1000)).isoformat()
+
+
+def _json_bytes(value) -> bytes:
+    """Encode a single JSON value"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Decode a single JSON value"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Strip + non-empty check expressed as constraints so it runs inside pydantic-core
+TaskDescription = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class Task(BaseModel):
     """Task model with validation"""
     
     id: str = Field(..., description="Unique identifier for the task")
-    description: str = Field(..., min_length=1, description="Task description")
+    description: TaskDescription = Field(..., description="Task description")
     completed: bool = Field(default=False, description="Completion status")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
+    created_at: int = Field(default_factory=time.time_ns, description="Creation timestamp (epoch nanoseconds)")
     
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v):
-        """Validate task description is not empty or whitespace-only"""
-        if not v or not v.strip():
-            raise ValueError('Task description cannot be empty or whitespace-only')
-        return v.strip()
-    
-    def to_dict(self) -> dict:
-        """Convert task to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'description': self.description,
-            'completed': self.completed,
-            'created_at': self.created_at.isoformat()
-        }
+    @field_serializer('created_at', when_used='json')
+    def serialize_created_at(self, created_at: int) -> str:
+        """Emit the creation timestamp as an ISO 8601 string in JSON output"""
+        return _format_timestamp(created_at)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
         """Create task from dictionary"""
-        # Handle datetime parsing if it's a string
+        # Accept ISO strings (as produced by JSON serialization) as well as epoch nanoseconds
         if isinstance(data.get('created_at'), str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
+            created_at = datetime.fromisoformat(data['created_at'])
+            if created_at.tzinfo is None:
+                created_at = created_at.astimezone()
+            data['created_at'] = (created_at - _EPOCH) // timedelta(microseconds=1) * 1000
         return cls(**data)
 
 
+class TaskCreate(BaseModel):
+    """Request body for creating a task"""
+    
+    model_config = ConfigDict(strict=True)
+    
+    description: TaskDescription = Field(..., description="Task description")
+
+
+class TaskUpdate(BaseModel):
+    """Request body for updating a task's completion status"""
+    
+    model_config = ConfigDict(strict=True)
+    
+    completed: bool = Field(..., description="Completion status")
+
+
+_TASK_ADAPTER = TypeAdapter(Task)
+
+# Adapters for parsing raw request bodies straight from JSON bytes
+TASK_CREATE_ADAPTER = TypeAdapter(TaskCreate)
+TASK_UPDATE_ADAPTER = TypeAdapter(TaskUpdate)
+
+
+@dataclass(slots=True)
+class TaskView:
+    """Read-only cursor over one row of a TaskStore"""
+    
+    store: 'TaskStore'
+    index: int
+    
+    @property
+    def id(self) -> str:
+        return self.store.ids[self.index]
+    
+    @property
+    def description(self) -> str:
+        return self.store.descriptions[self.index]
+    
+    @property
+    def completed(self) -> bool:
+        return bool(self.store.completed[self.index])
+    
+    @property
+    def created_at(self) -> int:
+        return self.store.created_at[self.index]
+    
+    def to_task(self) -> Task:
+        """Materialize the row as a Task model"""
+        return Task.model_construct(
+            id=self.id,
+            description=self.description,
+            completed=self.completed,
+            created_at=self.created_at,
+        )
+
+
+class TaskStore:
+    """
+    In-memory task list stored as parallel arrays (one container per field)
+    
+    Keeps per-task overhead low and lets bulk operations such as filtering
+    and serialization walk each field contiguously instead of chasing one
+    object per task.
+    """
+    
+    def __init__(self):
+        self.ids: list[str] = []
+        self.descriptions: list[str] = []
+        self.completed = bytearray()
+        self.created_at = array('q')
+        self._index: dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __iter__(self):
+        return (TaskView(self, i) for i in range(len(self.ids)))
+    
+    def add(self, task: Task) -> TaskView:
+        """Append a validated task, or overwrite the existing row with the same id"""
+        index = self._index.get(task.id)
+        if index is not None:
+            self.descriptions[index] = task.description
+            self.completed[index] = task.completed
+            self.created_at[index] = task.created_at
+            return TaskView(self, index)
+        
+        self._index[task.id] = len(self.ids)
+        self.ids.append(task.id)
+        self.descriptions.append(task.description)
+        self.completed.append(task.completed)
+        self.created_at.append(task.created_at)
+        return TaskView(self, len(self.ids) - 1)
+    
+    def get(self, task_id: str) -> Optional[TaskView]:
+        """Look up a task by id"""
+        index = self._index.get(task_id)
+        return None if index is None else TaskView(self, index)
+    
+    def set_completed(self, task_id: str, completed: bool) -> bool:
+        """Update a task's completion status, returning False if it is unknown"""
+        index = self._index.get(task_id)
+        if index is None:
+            return False
+        self.completed[index] = completed
+        return True
+    
+    def remove(self, task_id: str) -> bool:
+        """Delete a task by moving the last row into its slot, returning False if unknown"""
+        index = self._index.pop(task_id, None)
+        if index is None:
+            return False
+        last = len(self.ids) - 1
+        if index != last:
+            self.ids[index] = self.ids[last]
+            self.descriptions[index] = self.descriptions[last]
+            self.completed[index] = self.completed[last]
+            self.created_at[index] = self.created_at[last]
+            self._index[self.ids[index]] = index
+        self.ids.pop()
+        self.descriptions.pop()
+        self.completed.pop()
+        self.created_at.pop()
+        return True
+    
+    def to_json_all(self) -> bytes:
+        """Serialize every task as a JSON array, in the same shape as Task.model_dump_json"""
+        rows = [
+            b'{"id":%s,"description":%s,"completed":%s,"created_at":%s}' % (
+                _json_bytes(task_id),
+                _json_bytes(description),
+                b'true' if completed else b'false',
+                _json_bytes(_format_timestamp(created_at)),
+            )
+            for task_id, description, completed, created_at
+            in zip(self.ids, self.descriptions, self.completed, self.created_at)
+        ]
+        return b'[' + b','.join(rows) + b']'
+
+
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+
 class TaskManager:
     """Handles task operations and validation"""
     
+    def __init__(self, redis_client=None, cache_ttl: int = DEFAULT_CACHE_TTL):
+        """
+        Args:
+            redis_client: Optional redis.Redis client used to share tasks between workers
+            cache_ttl: Expiry in seconds for tasks stored in Redis
+        """
+        self.redis_client = redis_client
+        self.cache_ttl = cache_ttl
+    
     def create_task(self, description: str) -> Task:
         """Create a new task with validation"""
         task_id = self.generate_task_id()
-        return Task(id=task_id, description=description)
+        # str.strip() also treats the ASCII separators \x1c-\x1f as whitespace,
+        # which pydantic-core's strip does not, so strip here to keep that contract
+        task = _TASK_ADAPTER.validate_python({'id': task_id, 'description': description.strip()})
+        if self.redis_client is not None:
+            self.redis_client.setex(self._key(task_id), self.cache_ttl, task.model_dump_json())
+        return task
+    
+    def get_task_json(self, task_id: str) -> Optional[bytes]:
+        """Return the stored JSON for a task without re-validating it, or None if unknown"""
+        if self.redis_client is None:
+            return None
+        return self.redis_client.get(self._key(task_id))
+    
+    def update_task(self, task_id: str, completed: bool) -> bool:
+        """Set a stored task's completion status, returning False if it is unknown"""
+        if self.redis_client is None:
+            return False
+        key = self._key(task_id)
+        stored = self.redis_client.get(key)
+        if stored is None:
+            return False
+        # Patch the stored JSON directly; it is already in the serialized Task shape
+        data = _json_loads(stored)
+        data['completed'] = completed
+        # XX only writes if the key still exists, so a concurrent DELETE is not undone,
+        # and KEEPTTL leaves the original expiry in place
+        return self.redis_client.set(key, _json_bytes(data), xx=True, keepttl=True) is not None
+    
+    def delete_task(self, task_id: str) -> bool:
+        """Remove a stored task, returning True if it existed"""
+        if self.redis_client is None:
+            return False
+        return bool(self.redis_client.delete(self._key(task_id)))
     
     def validate_task_description(self, description: str) -> bool:
         """Validate task description is not empty or whitespace-only"""
         return bool(description and description.strip())
     
     def generate_task_id(self) -> str:
-        """Generate unique task identifier"""
-        return str(uuid.uuid4())
\ No newline at end of file
+        """Generate unique task identifier (random RFC 4122 version 4 UUID string)"""
+        b = bytearray(os.urandom(16))
+        b[6] = (b[6] & 0x0F) | 0x40  # version 4
+        b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = b.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    
+    @staticmethod
+    def _key(task_id: str) -> str:
+        """Redis key for a task"""
+        return f"task:{task_id}"
+
+
+def warmup() -> None:
+    """Run the task validation and serialization paths once so the first request does not pay for it"""
+    task = TaskManager().create_task('warmup')
+    task.model_dump_json()
+    TASK_CREATE_ADAPTER.validate_json(b'{"description": "warmup"}')
+    TASK_UPDATE_ADAPTER.validate_json(b'{"completed": true}')
\ No newline at end of file
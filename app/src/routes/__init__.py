@@ -1 +1,14 @@
-# Routes package
\ No newline at end of file
+# Routes package
+#
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in every blueprint and its dependencies.
+
+import importlib
+
+_SUBMODULES = ('main', 'help', 'contact', 'pages')
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
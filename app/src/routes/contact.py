@@ -2,7 +2,9 @@
 Contact routes for Todo App
 """
 
-from flask import Blueprint, render_template, abort
+from flask import Blueprint, abort, current_app
+
+from .pages import cached_page
 
 # Create the contact blueprint
 contact_bp = Blueprint('contact', __name__)
@@ -11,8 +13,7 @@ contact_bp = Blueprint('contact', __name__)
 def contact_page():
     """Render the contact page with support information"""
     try:
-        return render_template('contact.html')
-    except Exception as e:
-        # Log the error for debugging (in production, use proper logging)
-        print(f"Error rendering contact page: {str(e)}")
+        return cached_page('contact.html')
+    except Exception:
+        current_app.logger.exception("Error rendering contact page")
         abort(500)
\ No newline at end of file
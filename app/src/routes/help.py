@@ -2,7 +2,9 @@
 Help routes blueprint for todo app
 """
 
-from flask import Blueprint, render_template, abort
+from flask import Blueprint, abort, current_app
+
+from .pages import cached_page
 
 help_bp = Blueprint('help', __name__)
 
@@ -11,8 +13,7 @@ help_bp = Blueprint('help', __name__)
 def help_page():
     """Render the help page"""
     try:
-        return render_template('help.html')
-    except Exception as e:
-        # Log the error for debugging (in production, use proper logging)
-        print(f"Error rendering help page: {str(e)}")
+        return cached_page('help.html')
+    except Exception:
+        current_app.logger.exception("Error rendering help page")
         abort(500)
\ No newline at end of file
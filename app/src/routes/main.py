@@ -2,108 +2,148 @@
 Main routes blueprint for todo app
 """
 
-from flask import Blueprint, render_template, request, jsonify
-from pydantic import ValidationError
-from ..models import TaskManager
+import json
+from typing import TYPE_CHECKING
+
+from flask import Blueprint, current_app, render_template, request, jsonify
+
+from .pages import cached_page
+
+if TYPE_CHECKING:
+    from ..models import TaskManager
 
 main_bp = Blueprint('main', __name__)
-task_manager = TaskManager()
+
+
+def _json_error(message, status):
+    """Serialize a constant error payload once, at import time"""
+    return json.dumps({'error': message}, separators=(',', ':')).encode('utf-8'), status
+
+
+_ERR_CT_JSON = _json_error('Content-Type must be application/json', 400)
+_ERR_TASK_ID = _json_error('Task ID is required', 400)
+_ERR_NOT_FOUND = _json_error('Task not found', 404)
+_ERR_INTERNAL = _json_error('Internal server error', 500)
+
+
+def _error_response(error):
+    """Build a JSON response from a pre-serialized error payload"""
+    body, status = error
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def _get_task_manager(app=None) -> 'TaskManager':
+    """Return the app's TaskManager, importing the models on first use"""
+    if app is None:
+        app = current_app._get_current_object()
+    task_manager = app.extensions.get('task_manager')
+    if task_manager is None:
+        from ..models import TaskManager
+        from ..extensions import get_redis
+        task_manager = TaskManager(get_redis(), app.config['TASK_CACHE_TTL'])
+        app.extensions['task_manager'] = task_manager
+    return task_manager
 
 
 @main_bp.route('/')
 def index():
     """Render the main todo interface"""
-    return render_template('index.html')
+    return cached_page('index.html')
 
 
 @main_bp.route('/api/tasks', methods=['POST'])
 def create_task():
     """API endpoint for creating tasks"""
+    from pydantic import ValidationError
+    from ..models import TASK_CREATE_ADAPTER
+    
+    # Resolve the context-local proxies once instead of on every attribute access
+    app = current_app._get_current_object()
+    req = request._get_current_object()
+    
     # Check if this is a form submission (no JavaScript) or JSON API call
-    if request.content_type and 'application/json' in request.content_type:
+    is_json = req.mimetype == 'application/json'
+    if is_json:
         # Handle JSON API request
         try:
-            # Validate request content type
-            if not request.is_json:
-                return jsonify({'error': 'Content-Type must be application/json'}), 400
-            
-            data = request.get_json()
-            if not data:
-                return jsonify({'error': 'Request body is required'}), 400
-                
-            if 'description' not in data:
-                return jsonify({'error': 'Description field is required'}), 400
-            
-            description = data['description']
-            if not isinstance(description, str):
-                return jsonify({'error': 'Description must be a string'}), 400
-                
-            if not description.strip():
-                return jsonify({'error': 'Description cannot be empty or whitespace only'}), 400
-            
-            task = task_manager.create_task(description)
-            return jsonify(task.to_dict()), 201
+            # Parse and validate the raw body in one pass inside pydantic-core
+            body = TASK_CREATE_ADAPTER.validate_json(req.get_data())
+            task = _get_task_manager(app).create_task(body.description)
+            return app.response_class(task.model_dump_json(), status=201, mimetype='application/json')
             
         except ValidationError as e:
             return jsonify({'error': f'Validation error: {str(e)}'}), 400
-        except Exception as e:
-            # Log the error for debugging (in production, use proper logging)
-            print(f"Error creating task: {str(e)}")
-            return jsonify({'error': 'Internal server error'}), 500
+        except Exception:
+            app.logger.exception("Error creating task")
+            return _error_response(_ERR_INTERNAL)
     else:
         # Handle form submission (progressive enhancement)
         try:
-            description = request.form.get('description', '').strip()
+            description = req.form.get('description', '').strip()
             if not description:
                 # Redirect back with error message (in a real app, use flash messages)
                 return render_template('index.html', error='Please enter a task description'), 400
             
-            task = task_manager.create_task(description)
+            task = _get_task_manager(app).create_task(description)
             # Redirect back to main page (in a real app, show success message)
             return render_template('index.html', success=f'Task "{description}" added successfully'), 201
             
         except ValidationError as e:
             return render_template('index.html', error=f'Validation error: {str(e)}'), 400
-        except Exception as e:
-            # Log the error for debugging (in production, use proper logging)
-            print(f"Error creating task: {str(e)}")
+        except Exception:
+            app.logger.exception("Error creating task")
             return render_template('index.html', error='An error occurred while adding the task'), 500
 
 
+@main_bp.route('/api/tasks/<task_id>', methods=['GET'])
+def get_task(task_id):
+    """API endpoint for fetching a stored task"""
+    try:
+        # Stored bytes are already serialized JSON, so return them untouched
+        body = _get_task_manager().get_task_json(task_id)
+        if body is None:
+            return _error_response(_ERR_NOT_FOUND)
+        return current_app.response_class(body, status=200, mimetype='application/json')
+        
+    except Exception:
+        current_app.logger.exception("Error fetching task %s", task_id)
+        return _error_response(_ERR_INTERNAL)
+
+
 @main_bp.route('/api/tasks/<task_id>', methods=['PUT'])
 def update_task(task_id):
     """API endpoint for updating task completion status"""
+    from pydantic import ValidationError
+    from ..models import TASK_UPDATE_ADAPTER
+    
     try:
         # Validate task_id format
         if not task_id or not task_id.strip():
-            return jsonify({'error': 'Task ID is required'}), 400
+            return _error_response(_ERR_TASK_ID)
         
         # Validate request content type
         if not request.is_json:
-            return jsonify({'error': 'Content-Type must be application/json'}), 400
+            return _error_response(_ERR_CT_JSON)
         
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'Request body is required'}), 400
-            
-        if 'completed' not in data:
-            return jsonify({'error': 'Completed field is required'}), 400
+        try:
+            update = TASK_UPDATE_ADAPTER.validate_json(request.get_data())
+        except ValidationError as e:
+            return jsonify({'error': f'Validation error: {str(e)}'}), 400
         
-        completed = data['completed']
-        if not isinstance(completed, bool):
-            return jsonify({'error': 'Completed must be a boolean value'}), 400
+        # Tasks live client-side; when Redis is enabled, also update the stored copy
+        task_manager = _get_task_manager()
+        if task_manager.redis_client is not None and not task_manager.update_task(task_id, update.completed):
+            return _error_response(_ERR_NOT_FOUND)
         
-        # For now, return success - actual task storage will be client-side
         return jsonify({
             'id': task_id,
-            'completed': completed,
+            'completed': update.completed,
             'message': 'Task updated successfully'
         }), 200
         
-    except Exception as e:
-        # Log the error for debugging (in production, use proper logging)
-        print(f"Error updating task {task_id}: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+    except Exception:
+        current_app.logger.exception("Error updating task %s", task_id)
+        return _error_response(_ERR_INTERNAL)
 
 
 @main_bp.route('/api/tasks/<task_id>', methods=['DELETE'])
@@ -112,15 +152,15 @@ def delete_task(task_id):
     try:
         # Validate task_id format
         if not task_id or not task_id.strip():
-            return jsonify({'error': 'Task ID is required'}), 400
+            return _error_response(_ERR_TASK_ID)
         
-        # For now, return success - actual task storage will be client-side
+        # Tasks live client-side; also drop any server-side copy when Redis is enabled
+        _get_task_manager().delete_task(task_id)
         return jsonify({
             'id': task_id,
             'message': 'Task deleted successfully'
         }), 200
         
-    except Exception as e:
-        # Log the error for debugging (in production, use proper logging)
-        print(f"Error deleting task {task_id}: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
+    except Exception:
+        current_app.logger.exception("Error deleting task %s", task_id)
+        return _error_response(_ERR_INTERNAL)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Cached rendering for static pages
+"""
+
+import functools
+
+from flask import current_app, render_template
+
+HTML_HEADERS = {'Content-Type': 'text/html; charset=utf-8'}
+
+
+@functools.lru_cache(maxsize=8)
+def _render(name):
+    """Render a template that takes no context, once per process"""
+    return render_template(name).encode('utf-8')
+
+
+def cached_page(name, status=200):
+    """
+    Build a response for a template that does not change between requests
+    
+    Args:
+        name: Template name
+        status: HTTP status code for the response
+        
+    Returns:
+        tuple: Rendered body, status and headers
+    """
+    return _render(name), status, HTML_HEADERS
+
+
+def reset_page_cache():
+    """Drop all cached pages"""
+    _render.cache_clear()
+
+
+def clear_page_cache():
+    """Drop cached pages so edited templates show up (debug mode only)"""
+    if current_app.debug:
+        reset_page_cache()
\ No newline at end of file
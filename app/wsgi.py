@@ -0,0 +1,14 @@
+"""
+Todo App - WSGI entry point for production servers
+
+Run with: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+# Patch the standard library before Flask (or anything using sockets) is imported
+from gevent import monkey
+monkey.patch_all()
+
+from src.app import create_app  # noqa: E402
+
+# Create the Flask application instance, warmed up before it takes traffic
+app = create_app({'WARMUP': True})
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+from app.src.app import create_app
+
+
+@pytest.fixture(scope='session')
+def app():
+    """Flask app built once for the whole test session"""
+    return create_app({'TESTING': True})
+
+
+@pytest.fixture
+def client(app):
+    """Fresh test client per test"""
+    return app.test_client()
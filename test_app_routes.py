@@ -0,0 +1,256 @@
+"""
+Unit tests for the Flask app factory and routes
+"""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+
+from app.src.app import create_app
+from app.src.models import TaskManager
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.Redis methods TaskManager uses"""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def setex(self, key, ttl, value):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+    
+    def set(self, key, value, xx=False, keepttl=False):
+        if xx and key not in self.data:
+            return None
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        return True
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class TestAppFactory:
+    """Tests for create_app"""
+    
+    def test_create_app_reuses_instance(self, app):
+        """Repeated calls return the cached app with config reset to defaults"""
+        other = create_app({'CUSTOM_SETTING': 'value'})
+        assert other is app
+        assert other.config['CUSTOM_SETTING'] == 'value'
+        
+        again = create_app({'TESTING': True})
+        assert again is app
+        assert 'CUSTOM_SETTING' not in again.config
+        assert again.config['TESTING'] is True
+
+
+class TestJsonProvider:
+    """The app's JSON provider encodes like Flask's default provider"""
+    
+    @pytest.mark.parametrize('value', [
+        {'b': 1, 'a': 2},
+        Decimal('1.5'),
+        2 ** 70,
+        datetime.date(2020, 1, 1),
+        datetime.datetime(2020, 1, 1, 12, 30),
+        uuid.UUID('12345678-1234-4678-9234-567812345678'),
+        {'nested': [None, True, 1.25]},
+    ])
+    def test_matches_default_provider(self, app, value):
+        with app.app_context():
+            assert json.loads(app.json.dumps(value)) == json.loads(DefaultJSONProvider(app).dumps(value))
+    
+    def test_sorts_keys(self, app):
+        with app.app_context():
+            assert app.json.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+            assert app.json.dumps({'b': 1, 'a': 2}, sort_keys=False) == '{"b":1,"a":2}'
+    
+    def test_unserializable_still_raises(self, app):
+        with app.app_context(), pytest.raises(TypeError):
+            app.json.dumps(object())
+
+
+class TestTemplateConfig:
+    """Tests for the Jinja environment setup in create_app"""
+    
+    def test_production_uses_precompiled_templates(self, app, tmp_path):
+        """Outside debug mode templates come from the archive and are not re-checked on disk"""
+        archive = str(tmp_path / 'templates.zip')
+        app.jinja_env.compile_templates(archive, zip='deflated')
+        try:
+            configured = create_app({
+                'TESTING': True,
+                'JINJA_PRECOMPILED_TEMPLATES': archive,
+                'JINJA_BYTECODE_CACHE_DIR': str(tmp_path),
+            })
+            assert configured.jinja_env.auto_reload is False
+            assert isinstance(configured.jinja_env.loader, ChoiceLoader)
+            assert isinstance(configured.jinja_env.loader.loaders[0], ModuleLoader)
+            assert isinstance(configured.jinja_env.bytecode_cache, FileSystemBytecodeCache)
+            assert configured.jinja_env.get_template('help.html').filename.startswith(archive)
+            
+            client = configured.test_client()
+            assert client.get('/help').status_code == 200
+            assert client.get('/does-not-exist').status_code == 404
+        finally:
+            create_app({'TESTING': True})
+    
+    def test_debug_reloads_templates_from_disk(self, app, tmp_path):
+        """Debug mode ignores the archive and bytecode cache and re-enables auto_reload"""
+        archive = str(tmp_path / 'templates.zip')
+        app.jinja_env.compile_templates(archive, zip='deflated')
+        try:
+            configured = create_app({
+                'DEBUG': True,
+                'JINJA_PRECOMPILED_TEMPLATES': archive,
+                'JINJA_BYTECODE_CACHE_DIR': str(tmp_path),
+            })
+            assert configured.jinja_env.auto_reload is True
+            assert not isinstance(configured.jinja_env.loader, ChoiceLoader)
+            assert configured.jinja_env.bytecode_cache is None
+        finally:
+            create_app({'TESTING': True})
+    
+    def test_loader_change_clears_cached_pages(self, app, client, tmp_path):
+        """Pages rendered before a loader change are not served afterwards"""
+        templates = tmp_path / 'templates'
+        templates.mkdir()
+        (templates / 'help.html').write_text('precompiled help page')
+        archive = str(tmp_path / 'templates.zip')
+        Environment(loader=FileSystemLoader(str(templates))).compile_templates(archive, zip='deflated')
+        
+        assert b'precompiled help page' not in client.get('/help').data
+        try:
+            create_app({'TESTING': True, 'JINJA_PRECOMPILED_TEMPLATES': archive})
+            assert client.get('/help').data == b'precompiled help page'
+        finally:
+            create_app({'TESTING': True})
+        assert b'precompiled help page' not in client.get('/help').data
+
+
+class TestRoutes:
+    """Tests for page and API routes"""
+    
+    def test_pages_render(self, client):
+        """Main, help and contact pages render successfully"""
+        for path in ('/', '/help', '/contact'):
+            response = client.get(path)
+            assert response.status_code == 200
+            assert response.mimetype == 'text/html'
+    
+    def test_unknown_path_serves_main_page(self, client):
+        """Unknown paths fall back to the main page with a 404 status"""
+        response = client.get('/does-not-exist')
+        assert response.status_code == 404
+        assert response.data == client.get('/').data
+    
+    def test_create_task_json(self, client):
+        """Creating a task via JSON returns the serialized task"""
+        response = client.post('/api/tasks', json={'description': '  Buy milk  '})
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['description'] == 'Buy milk'
+        assert data['completed'] is False
+        assert isinstance(data['created_at'], str)
+    
+    def test_create_task_json_rejects_blank(self, client):
+        """Whitespace-only descriptions are rejected"""
+        response = client.post('/api/tasks', json={'description': '   '})
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+    
+    def test_update_task(self, client):
+        """Updating completion status echoes the new state"""
+        response = client.put('/api/tasks/abc', json={'completed': True})
+        assert response.status_code == 200
+        assert response.get_json()['completed'] is True
+    
+    def test_update_task_requires_boolean(self, client):
+        """Non-boolean completion values are rejected"""
+        response = client.put('/api/tasks/abc', json={'completed': 'yes'})
+        assert response.status_code == 400
+    
+    def test_update_task_requires_json(self, client):
+        """Non-JSON update requests get the Content-Type error"""
+        response = client.put('/api/tasks/abc', data='completed=true')
+        assert response.status_code == 400
+        assert response.get_json() == {'error': 'Content-Type must be application/json'}
+    
+    def test_update_task_accepts_json_suffix_types(self, client):
+        """Any +json media type counts as JSON"""
+        response = client.put(
+            '/api/tasks/abc',
+            data='{"completed": true}',
+            content_type='application/vnd.api+json',
+        )
+        assert response.status_code == 200
+    
+    def test_delete_task(self, client):
+        """Deleting a task returns its id"""
+        response = client.delete('/api/tasks/abc')
+        assert response.status_code == 200
+        assert response.get_json()['id'] == 'abc'
+    
+    def test_get_unknown_task(self, client):
+        """Fetching a task that is not stored returns 404"""
+        response = client.get('/api/tasks/abc')
+        assert response.status_code == 404
+    
+    def test_stored_task_round_trip(self, app, client):
+        """With a Redis store, created tasks can be fetched and deleted"""
+        app.extensions['task_manager'] = TaskManager(FakeRedis())
+        try:
+            created = client.post('/api/tasks', json={'description': 'Stored'}).get_json()
+            
+            response = client.get(f"/api/tasks/{created['id']}")
+            assert response.status_code == 200
+            assert response.get_json() == created
+            
+            response = client.put(f"/api/tasks/{created['id']}", json={'completed': True})
+            assert response.status_code == 200
+            assert client.get(f"/api/tasks/{created['id']}").get_json() == dict(created, completed=True)
+            
+            assert client.put('/api/tasks/unknown', json={'completed': True}).status_code == 404
+            
+            client.delete(f"/api/tasks/{created['id']}")
+            assert client.get(f"/api/tasks/{created['id']}").status_code == 404
+        finally:
+            app.extensions.pop('task_manager', None)
+    
+    def test_update_task_does_not_recreate_deleted_task(self):
+        """A DELETE landing between update_task's read and write is not undone"""
+        redis = FakeRedis()
+        manager = TaskManager(redis)
+        task = manager.create_task('Stored')
+        key = manager._key(task.id)
+        stale = redis.get(key)
+        redis.delete(key)
+        redis.get = lambda _key: stale
+        
+        assert manager.update_task(task.id, True) is False
+        assert key not in redis.data
+    
+    def test_create_task_store_failure_uses_view_error_handling(self, app, client, caplog):
+        """A task store that cannot be set up is handled by create_task's own error paths"""
+        # Either the redis extra is missing or nothing listens on this port
+        create_app({'TESTING': True, 'REDIS_URL': 'redis://127.0.0.1:1/0'})
+        try:
+            response = client.post('/api/tasks', json={'description': 'Task'})
+            assert response.status_code == 500
+            assert response.get_json() == {'error': 'Internal server error'}
+            assert 'Error creating task' in caplog.text
+            
+            response = client.post('/api/tasks', data={'description': 'Task'})
+            assert response.status_code == 500
+            assert response.mimetype == 'text/html'
+            assert b'An error occurred while adding the task' in response.data
+        finally:
+            create_app({'TESTING': True})
@@ -2,10 +2,23 @@
 Property-based tests for Task model validation
 """
 
+import json
+import uuid
+
 import pytest
 from hypothesis import given, strategies as st, settings
 from pydantic import ValidationError
-from app.src.models import Task, TaskManager
+from app.src.models import Task, TaskManager, TaskStore
+
+
+def _filled_store(descriptions):
+    """Create a task per description and add them all to a new TaskStore"""
+    manager = TaskManager()
+    store = TaskStore()
+    tasks = [manager.create_task(description) for description in descriptions]
+    for task in tasks:
+        store.add(task)
+    return store, tasks
 
 
 class TestTaskModelProperties:
@@ -54,8 +67,8 @@ class TestTaskModelProperties:
         manager = TaskManager()
         original_task = manager.create_task(description)
         
-        # Serialize to dict
-        task_dict = original_task.to_dict()
+        # Serialize to a JSON-compatible dict
+        task_dict = original_task.model_dump(mode='json')
         
         # Deserialize back to Task
         restored_task = Task.from_dict(task_dict)
@@ -64,8 +77,8 @@ class TestTaskModelProperties:
         assert restored_task.id == original_task.id
         assert restored_task.description == original_task.description
         assert restored_task.completed == original_task.completed
-        # Note: datetime comparison might have slight precision differences
-        assert abs((restored_task.created_at - original_task.created_at).total_seconds()) < 1
+        # Note: the ISO form only keeps microseconds, so sub-microsecond precision is lost
+        assert abs(restored_task.created_at - original_task.created_at) < 1000
 
     @given(st.text().filter(lambda x: x and x.strip()))
     @settings(max_examples=5)
@@ -89,4 +102,105 @@ class TestTaskModelProperties:
         # List should grow by one
         assert len(task_list) == initial_length + 1
         assert task in task_list
-        assert task.description == description.strip()
\ No newline at end of file
+        assert task.description == description.strip()
+
+    def test_generated_ids_are_uuid4(self):
+        """
+        Generated task IDs are unique, canonical RFC 4122 version 4 UUID strings
+        Feature: todo-app, Task ID format
+        """
+        manager = TaskManager()
+        task_ids = [manager.generate_task_id() for _ in range(100)]
+        
+        assert len(set(task_ids)) == len(task_ids)
+        for task_id in task_ids:
+            parsed = uuid.UUID(task_id)
+            assert str(parsed) == task_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
+    @given(st.lists(st.text().filter(lambda x: x and x.strip()), max_size=10))
+    @settings(max_examples=5)
+    def test_task_store_serialization_matches_model(self, descriptions):
+        """
+        Property: TaskStore bulk serialization matches per-task serialization
+        For any list of valid tasks, to_json_all should equal serializing each Task
+        Feature: todo-app, Property: Task store serialization
+        """
+        store, tasks = _filled_store(descriptions)
+        
+        assert len(store) == len(tasks)
+        assert json.loads(store.to_json_all()) == [json.loads(task.model_dump_json()) for task in tasks]
+        for task in tasks:
+            assert store.get(task.id).to_task() == task
+    
+    @given(st.lists(st.text().filter(lambda x: x and x.strip()), min_size=1, max_size=10))
+    @settings(max_examples=5)
+    def test_task_store_remove(self, descriptions):
+        """
+        Property: Removing a task from the store leaves the others intact
+        Feature: todo-app, Property: Task store removal
+        """
+        store, tasks = _filled_store(descriptions)
+        
+        removed = tasks.pop(0)
+        assert store.remove(removed.id)
+        assert store.get(removed.id) is None
+        assert sorted(view.id for view in store) == sorted(task.id for task in tasks)
+        for task in tasks:
+            assert store.get(task.id).description == task.description
+    
+    @given(st.lists(st.text().filter(lambda x: x and x.strip()), min_size=2, max_size=10))
+    @settings(max_examples=5)
+    def test_task_store_remove_moves_last_row(self, descriptions):
+        """
+        Property: The row moved into a removed task's slot keeps all of its fields
+        Feature: todo-app, Property: Task store removal
+        """
+        store, tasks = _filled_store(descriptions)
+        moved = tasks[-1].model_copy(update={'completed': True})
+        store.set_completed(moved.id, True)
+        
+        assert store.remove(tasks[0].id)
+        view = store.get(moved.id)
+        assert view.index == 0
+        assert view.completed is True
+        assert view.created_at == moved.created_at
+        assert view.to_task() == moved
+    
+    @given(st.lists(st.text().filter(lambda x: x and x.strip()), min_size=1, max_size=10))
+    @settings(max_examples=5)
+    def test_task_store_set_completed(self, descriptions):
+        """
+        Property: set_completed updates only the named task and rejects unknown ids
+        Feature: todo-app, Property: Task store completion
+        """
+        store, tasks = _filled_store(descriptions)
+        
+        assert store.set_completed(tasks[0].id, True)
+        assert store.get(tasks[0].id).completed is True
+        assert all(not store.get(task.id).completed for task in tasks[1:])
+        
+        assert store.set_completed(tasks[0].id, False)
+        assert store.get(tasks[0].id).completed is False
+        assert not store.set_completed('unknown', True)
+        assert len(store) == len(tasks)
+    
+    @given(st.lists(st.text().filter(lambda x: x and x.strip()), min_size=1, max_size=10))
+    @settings(max_examples=5)
+    def test_task_store_add_existing_id_overwrites(self, descriptions):
+        """
+        Property: Adding a task whose id is already stored replaces that row
+        Feature: todo-app, Property: Task store upsert
+        """
+        store, tasks = _filled_store(descriptions)
+        
+        updated = tasks[0].model_copy(update={'completed': True})
+        store.add(updated)
+        assert len(store) == len(tasks)
+        assert store.get(updated.id).to_task() == updated
+        
+        assert store.remove(updated.id)
+        assert len(store) == len(tasks) - 1
+        assert store.get(updated.id) is None
+        assert updated.id not in [view.id for view in store]
\ No newline at end of file